@@ -1,61 +1,226 @@
+import heapq
 import streamlit as st
 import random
-import re
+import string
+from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
+# NumPy and Numba are optional accelerators: with NumPy alone, large pastes
+# get vectorized tokenization; with Numba too, they get a JIT-compiled
+# tokenize+count kernel. The regex path always remains as the fallback.
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+try:
+    from numba import njit
+    _HAS_NUMBA = _HAS_NUMPY
+except ImportError:
+    _HAS_NUMBA = False
+
+# Folds '!' and '?' into '.' so sentence splitting is a plain str.split,
+# with the len>10 filter absorbing any empty fragments from runs like '?!'
+_SENT_TRANS = str.maketrans('!?', '..')
+
+# Strips punctuation and digits in a single C-level table lookup pass,
+# letting tokenization run on plain str.split instead of the regex engine
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation + string.digits)
+
+# Common stopwords, built once at import instead of per extract_key_terms call
+_STOPWORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+                        'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+                        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+                        'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'})
+
+# Texts shorter than this skip the JIT kernel, where dispatch overhead
+# would dominate
+_NUMBA_MIN_CHARS = 4096
+
+# Below this size NumPy array setup costs more than the plain-string walk saves
+_NP_MIN_CHARS = 1024
+
+if _HAS_NUMPY:
+    # Stopwords as bytes, for filtering tokens sliced out of the byte array
+    _STOPWORD_BYTES = frozenset(w.encode('ascii') for w in _STOPWORDS)
+
+    def _extract_key_terms_np(text: str) -> List[str]:
+        """Top-10 key terms via vectorized NumPy tokenization.
+
+        Lowercases and finds word boundaries with whole-array operations
+        (branchless bit-OR lowercase, diff of the alpha mask) instead of a
+        per-character regex walk; non-ASCII chars are dropped.
+        """
+        arr = np.frombuffer(text.encode('ascii', 'ignore'), dtype=np.uint8).copy()
+        arr[(arr >= 65) & (arr <= 90)] |= 0x20
+        alpha = (arr >= 97) & (arr <= 122)
+
+        # Word starts/ends fall where the zero-padded alpha mask flips
+        padded = np.zeros(alpha.size + 2, dtype=np.int8)
+        padded[1:-1] = alpha
+        edges = np.diff(padded)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        keep = (ends - starts) > 3
+
+        raw = arr.tobytes()
+        tokens = (raw[s:e] for s, e in zip(starts[keep].tolist(), ends[keep].tolist()))
+        counts = Counter(word for word in tokens if word not in _STOPWORD_BYTES)
+        return [term.decode('ascii') for term, freq in counts.most_common(10)]
+
+if _HAS_NUMBA:
+    def _fnv1a(word: str) -> int:
+        """64-bit FNV-1a hash, matching the kernel's per-word hashing."""
+        h = 0xcbf29ce484222325
+        for byte in word.encode('ascii'):
+            h = ((h ^ byte) * 0x100000001b3) & 0xFFFFFFFFFFFFFFFF
+        return h
+
+    # Stopword hashes, sorted so the kernel can binary-search them
+    _STOPWORD_HASHES = np.sort(np.array([_fnv1a(w) for w in _STOPWORDS], dtype=np.uint64))
+
+    @njit(cache=True)
+    def _numba_count_words(data, stop_hashes):
+        """Scan ASCII bytes, counting FNV-1a hashes of lowercased words.
+
+        Returns parallel arrays of counts and packed (start << 32 | length)
+        first-occurrence positions, one entry per distinct word longer than
+        3 chars that is not a stopword.
+        """
+        counts = {}
+        first_pos = {}
+        n = data.shape[0]
+        i = 0
+        while i < n:
+            c = data[i]
+            if not ((65 <= c <= 90) or (97 <= c <= 122)):
+                i += 1
+                continue
+            start = i
+            h = np.uint64(0xcbf29ce484222325)
+            while i < n:
+                c = data[i]
+                if 65 <= c <= 90:
+                    c = c | 0x20
+                elif not (97 <= c <= 122):
+                    break
+                h = (h ^ np.uint64(c)) * np.uint64(0x100000001b3)
+                i += 1
+            length = i - start
+            if length > 3:
+                lo = 0
+                hi = stop_hashes.shape[0]
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if stop_hashes[mid] < h:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                if lo == stop_hashes.shape[0] or stop_hashes[lo] != h:
+                    if h in counts:
+                        counts[h] += 1
+                    else:
+                        counts[h] = 1
+                        first_pos[h] = (np.int64(start) << 32) | np.int64(length)
+        out_counts = np.empty(len(counts), dtype=np.int64)
+        out_pos = np.empty(len(counts), dtype=np.int64)
+        j = 0
+        for h in counts:
+            out_counts[j] = counts[h]
+            out_pos[j] = first_pos[h]
+            j += 1
+        return out_counts, out_pos
+
+    def _extract_key_terms_numba(text: str) -> List[str]:
+        """Top-10 key terms via the JIT kernel; non-ASCII chars are dropped."""
+        encoded = text.encode('ascii', 'ignore')
+        data = np.frombuffer(encoded, dtype=np.uint8)
+        counts, positions = _numba_count_words(data, _STOPWORD_HASHES)
+        top = heapq.nlargest(10, range(len(counts)), key=counts.__getitem__)
+        terms = []
+        for idx in top:
+            pos = int(positions[idx])
+            start, length = pos >> 32, pos & 0xFFFFFFFF
+            terms.append(encoded[start:start + length].decode('ascii').lower())
+        return terms
+
+# Template pools are immutable, so build them once at import instead of
+# re-allocating lists in every QuizGenerator() constructed per click
+_ASSIGNMENT_TEMPLATES = (
+    "Analyze the main themes in the following content: {}",
+    "Discuss the key concepts and their relationships in: {}",
+    "Evaluate the arguments presented in: {}",
+    "Compare and contrast different viewpoints on: {}",
+    "Explain the significance and implications of: {}",
+    "Critically examine the evidence presented for: {}",
+    "Describe the process or methodology outlined in: {}",
+    "Assess the strengths and weaknesses of: {}"
+)
+
+_QUESTION_STARTERS = (
+    "What is the main",
+    "Which of the following",
+    "According to the text",
+    "The primary purpose",
+    "What does the author",
+    "Which statement best",
+    "The text suggests that",
+    "What can be inferred"
+)
+
+@lru_cache(maxsize=4)
+def _prep(text: str) -> Tuple[str, List[str]]:
+    """Lowercase the text and split it into sentences in one cached step.
+
+    Key-term extraction and sentence extraction both run on every generate
+    click; sharing the memoized artifacts means the input is walked once
+    instead of once per helper.
+    """
+    sentences = text.translate(_SENT_TRANS).split('.')
+    return text.lower(), [s.strip() for s in sentences if len(s.strip()) > 10]
+
+@lru_cache(maxsize=16)
+def _extract_key_terms(text: str) -> List[str]:
+    """Extract key terms from the text using simple heuristics.
+
+    Memoized on the text so generating assignments and quiz questions
+    back-to-back parses the input only once.
+    """
+    # Book-length pastes take the JIT kernel when Numba is installed, or the
+    # vectorized NumPy tokenizer when only NumPy is; small texts stay on the
+    # translate+split path
+    if _HAS_NUMBA and len(text) >= _NUMBA_MIN_CHARS:
+        return _extract_key_terms_numba(text)
+    if _HAS_NUMPY and len(text) >= _NP_MIN_CHARS:
+        return _extract_key_terms_np(text)
+
+    # Strip punctuation/digits with one translate pass and split in C, then
+    # stream tokens straight into Counter; most_common(10) does a partial sort
+    lower_text = _prep(text)[0]
+    words = lower_text.translate(_PUNCT_TABLE).split()
+    counts = Counter(
+        word for word in words
+        if len(word) > 3 and word.isalpha() and word not in _STOPWORDS
+    )
+    return [term for term, freq in counts.most_common(10)]
+
+def _extract_sentences(text: str) -> List[str]:
+    """Split text into sentences, memoized via _prep."""
+    return _prep(text)[1]
+
 class QuizGenerator:
-    def __init__(self):
-        self.assignment_templates = [
-            "Analyze the main themes in the following content: {}",
-            "Discuss the key concepts and their relationships in: {}",
-            "Evaluate the arguments presented in: {}",
-            "Compare and contrast different viewpoints on: {}",
-            "Explain the significance and implications of: {}",
-            "Critically examine the evidence presented for: {}",
-            "Describe the process or methodology outlined in: {}",
-            "Assess the strengths and weaknesses of: {}"
-        ]
-        
-        self.question_starters = [
-            "What is the main",
-            "Which of the following",
-            "According to the text",
-            "The primary purpose",
-            "What does the author",
-            "Which statement best",
-            "The text suggests that",
-            "What can be inferred"
-        ]
-        
     def extract_key_terms(self, text: str) -> List[str]:
         """Extract key terms from the text using simple heuristics."""
-        # Remove common stopwords
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'}
-        
-        # Extract words (remove punctuation and convert to lowercase)
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-        
-        # Filter out stopwords and short words
-        key_terms = [word for word in words if word not in stopwords and len(word) > 3]
-        
-        # Get unique terms and their frequency
-        term_freq = {}
-        for term in key_terms:
-            term_freq[term] = term_freq.get(term, 0) + 1
-        
-        # Sort by frequency and return top terms
-        sorted_terms = sorted(term_freq.items(), key=lambda x: x[1], reverse=True)
-        return [term for term, freq in sorted_terms[:10]]
-    
+        return _extract_key_terms(text)
+
     def extract_sentences(self, text: str) -> List[str]:
         """Split text into sentences."""
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if len(s.strip()) > 10]
+        return _extract_sentences(text)
     
-    def generate_assignments(self, text: str, topic: str = None) -> List[str]:
+    def generate_assignments(self, text: str, topic: str = None,
+                             rng: random.Random = random) -> List[str]:
         """Generate assignment questions based on the input text."""
         assignments = []
         
@@ -63,8 +228,8 @@ class QuizGenerator:
         subject = topic if topic else self.extract_main_subject(text)
         
         # Select random templates and generate assignments
-        selected_templates = random.sample(self.assignment_templates, 2)
-        
+        selected_templates = rng.sample(_ASSIGNMENT_TEMPLATES, 2)
+
         for template in selected_templates:
             assignment = template.format(subject)
             assignments.append(assignment)
@@ -79,52 +244,57 @@ class QuizGenerator:
         else:
             return "the given content"
     
-    def generate_quiz_questions(self, text: str) -> List[Dict]:
+    def generate_quiz_questions(self, text: str,
+                                rng: random.Random = random) -> List[Dict]:
         """Generate multiple choice questions from the text."""
         sentences = self.extract_sentences(text)
         key_terms = self.extract_key_terms(text)
-        
+
+        # Pick the definition-question term once up front instead of slicing
+        # key_terms[:5] inside the per-question loop
+        chosen_term = key_terms[rng.randrange(min(5, len(key_terms)))] if key_terms else None
+
         questions = []
         
         # Generate questions based on available content
         for i in range(3):
-            question_data = self.create_question(sentences, key_terms, i)
+            question_data = self.create_question(sentences, key_terms, i, rng, chosen_term)
             questions.append(question_data)
         
         return questions
     
-    def create_question(self, sentences: List[str], key_terms: List[str], question_num: int) -> Dict:
+    def create_question(self, sentences: List[str], key_terms: List[str], question_num: int,
+                        rng: random.Random = random, chosen_term: str = None) -> Dict:
         """Create a single multiple choice question."""
-        question_types = [
-            self.create_definition_question,
-            self.create_comprehension_question,
-            self.create_inference_question
-        ]
-        
-        # Use different question types
-        question_type = question_types[question_num % len(question_types)]
-        return question_type(sentences, key_terms)
+        # Rotate through the class-level dispatch tuple (no per-call list of
+        # bound methods)
+        question_type = self._QUESTION_TYPES[question_num % len(self._QUESTION_TYPES)]
+        return question_type(self, sentences, key_terms, rng, chosen_term)
     
-    def create_definition_question(self, sentences: List[str], key_terms: List[str]) -> Dict:
+    def create_definition_question(self, sentences: List[str], key_terms: List[str],
+                                   rng: random.Random = random, chosen_term: str = None) -> Dict:
         """Create a definition-based question."""
         if not key_terms:
             return self.create_fallback_question(sentences)
         
-        term = random.choice(key_terms[:5])  # Use top 5 terms
+        # Use the term chosen by the caller, or pick from the top 5 terms
+        term = chosen_term if chosen_term is not None else rng.choice(key_terms[:5])
         
         question = f"What is the main focus regarding '{term}' in the text?"
         
-        # Generate plausible options
-        correct_answer = f"The text discusses {term} in the context provided"
+        # Generate plausible options (correct answer first, then permute;
+        # tracking the permutation avoids an O(n) string .index() scan)
         options = [
-            correct_answer,
+            f"The text discusses {term} in the context provided",
             f"{term} is completely unrelated to the main topic",
             f"{term} is mentioned only in passing without significance",
             f"The text contradicts common understanding of {term}"
         ]
-        
-        random.shuffle(options)
-        correct_index = options.index(correct_answer)
+
+        perm = list(range(len(options)))
+        rng.shuffle(perm)
+        options = [options[i] for i in perm]
+        correct_index = perm.index(0)
         
         return {
             'question': question,
@@ -133,26 +303,29 @@ class QuizGenerator:
             'explanation': f"The correct answer focuses on how {term} relates to the main content."
         }
     
-    def create_comprehension_question(self, sentences: List[str], key_terms: List[str]) -> Dict:
+    def create_comprehension_question(self, sentences: List[str], key_terms: List[str],
+                                      rng: random.Random = random, chosen_term: str = None) -> Dict:
         """Create a comprehension-based question."""
         if not sentences:
             return self.create_fallback_question(sentences)
         
-        sentence = random.choice(sentences[:3])  # Use first few sentences
+        sentence = rng.choice(sentences[:3])  # Use first few sentences
         
         question = f"According to the text, which statement is most accurate?"
         
-        # Create options based on the sentence
-        correct_answer = f"The text mentions: {sentence[:50]}..."
+        # Create options based on the sentence (same permutation trick as
+        # create_definition_question)
         options = [
-            correct_answer,
+            f"The text mentions: {sentence[:50]}...",
             "The text primarily focuses on historical events",
             "The content is mainly theoretical without practical application",
             "The text contradicts established principles in the field"
         ]
-        
-        random.shuffle(options)
-        correct_index = options.index(correct_answer)
+
+        perm = list(range(len(options)))
+        rng.shuffle(perm)
+        options = [options[i] for i in perm]
+        correct_index = perm.index(0)
         
         return {
             'question': question,
@@ -161,7 +334,8 @@ class QuizGenerator:
             'explanation': "This option best reflects the content mentioned in the text."
         }
     
-    def create_inference_question(self, sentences: List[str], key_terms: List[str]) -> Dict:
+    def create_inference_question(self, sentences: List[str], key_terms: List[str],
+                                  rng: random.Random = random, chosen_term: str = None) -> Dict:
         """Create an inference-based question."""
         question = "What can be inferred from the overall content?"
         
@@ -197,6 +371,118 @@ class QuizGenerator:
             'explanation': "The text provides information that can be analyzed."
         }
 
+    # Question-type rotation used by create_question, built once at class scope
+    _QUESTION_TYPES = (create_definition_question, create_comprehension_question,
+                       create_inference_question)
+
+# The class is stateless (templates live at module scope), so one shared
+# instance serves every rerun
+_GENERATOR = QuizGenerator()
+
+@st.cache_data(show_spinner=False)
+def _cached_generate(text: str, topic: str, seed: int) -> Tuple[List[str], List[Dict]]:
+    """Generate assignments and quiz questions, cached across Streamlit reruns.
+
+    Streamlit re-executes the whole script on every widget interaction, so
+    caching on (text, topic, seed) avoids re-parsing the same input each click.
+    """
+    rng = random.Random(seed)
+    return (_GENERATOR.generate_assignments(text, topic, rng),
+            _GENERATOR.generate_quiz_questions(text, rng))
+
+# Runs as a fragment so widget interactions inside (checkbox, radio,
+# submit) rerun only this section, not the sidebar and input area
+@st.fragment
+def _generation_section(input_text: str, topic: str):
+    # The button only generates into session_state; rendering below reads
+    # from session_state so radio picks and checkbox toggles reuse the stored
+    # quiz instead of regenerating it on every rerun
+    if st.button("🚀 Generate Assignments & Quiz", type="primary", use_container_width=True):
+        if input_text.strip():
+            with st.spinner("Generating assignments and quiz questions..."):
+                # Seed deterministically on the inputs so reruns with the same
+                # text/topic hit the cache and keep the same quiz on screen
+                seed = hash((input_text, topic))
+                st.session_state['generated'] = _cached_generate(input_text, topic, seed)
+            st.success("✅ Generation complete!")
+        else:
+            st.error("⚠️ Please enter some text content to generate assignments and quiz questions.")
+
+    if 'generated' in st.session_state:
+        assignments, quiz_questions = st.session_state['generated']
+
+        # Assignments section
+        st.header("📄 Assignment Questions")
+        for i, assignment in enumerate(assignments, 1):
+            st.subheader(f"Assignment {i}")
+            st.write(assignment)
+            st.markdown("---")
+        
+        # Quiz section
+        st.header("❓ Quiz Questions")
+        
+        # Option to take quiz interactively
+        if st.checkbox("🎮 Take Quiz Interactively"):
+            score = 0
+            user_answers = []
+            
+            for i, q in enumerate(quiz_questions):
+                st.subheader(f"Question {i+1}")
+                st.write(q['question'])
+                
+                user_answer = st.radio(
+                    f"Select your answer for Question {i+1}:",
+                    options=range(len(q['options'])),
+                    format_func=lambda x: f"{chr(65+x)}. {quiz_questions[st.session_state.get('current_q', i)]['options'][x]}",
+                    key=f"q_{i}"
+                )
+                user_answers.append(user_answer)
+            
+            if st.button("Submit Quiz"):
+                for i, (user_ans, q) in enumerate(zip(user_answers, quiz_questions)):
+                    if user_ans == q['correct_answer']:
+                        score += 1
+                
+                st.balloons()
+                st.success(f"🎉 Your Score: {score}/{len(quiz_questions)} ({score/len(quiz_questions)*100:.1f}%)")
+        
+        else:
+            # Display quiz with answers
+            for i, q in enumerate(quiz_questions, 1):
+                with st.expander(f"Question {i}: {q['question']}", expanded=True):
+                    for j, option in enumerate(q['options']):
+                        if j == q['correct_answer']:
+                            st.success(f"✅ {chr(65+j)}. {option}")
+                        else:
+                            st.write(f"{chr(65+j)}. {option}")
+                    
+                    st.info(f"💡 Explanation: {q['explanation']}")
+        
+        # Download section
+        st.header("💾 Export Options")
+        
+        # Create downloadable content (accumulate parts and join once;
+        # repeated += on a string is quadratic in the number of fragments)
+        parts = ["# Generated Assignments and Quiz\n\n## Assignment Questions\n\n"]
+        for i, assignment in enumerate(assignments, 1):
+            parts.append(f"**Assignment {i}:**\n{assignment}\n\n")
+
+        parts.append("## Quiz Questions\n\n")
+        for i, q in enumerate(quiz_questions, 1):
+            parts.append(f"**Question {i}:** {q['question']}\n")
+            for j, option in enumerate(q['options']):
+                marker = "✅" if j == q['correct_answer'] else "  "
+                parts.append(f"{marker} {chr(65+j)}. {option}\n")
+            parts.append(f"*Explanation: {q['explanation']}*\n\n")
+        export_content = "".join(parts)
+        
+        st.download_button(
+            label="📄 Download as Text File",
+            data=export_content,
+            file_name="assignments_and_quiz.txt",
+            mime="text/plain"
+        )
+
 def main():
     st.set_page_config(
         page_title="Assignment & Quiz Generator",
@@ -247,95 +533,9 @@ def main():
         st.header("⚙️ Settings")
         difficulty = st.selectbox("Question Difficulty:", ["Mixed", "Basic", "Intermediate", "Advanced"])
     
-    # Generate button
-    if st.button("🚀 Generate Assignments & Quiz", type="primary", use_container_width=True):
-        if input_text.strip():
-            generator = QuizGenerator()
-            
-            with st.spinner("Generating assignments and quiz questions..."):
-                # Generate assignments
-                assignments = generator.generate_assignments(input_text, topic)
-                
-                # Generate quiz questions
-                quiz_questions = generator.generate_quiz_questions(input_text)
-            
-            # Display results
-            st.success("✅ Generation complete!")
-            
-            # Assignments section
-            st.header("📄 Assignment Questions")
-            for i, assignment in enumerate(assignments, 1):
-                st.subheader(f"Assignment {i}")
-                st.write(assignment)
-                st.markdown("---")
-            
-            # Quiz section
-            st.header("❓ Quiz Questions")
-            
-            # Option to take quiz interactively
-            if st.checkbox("🎮 Take Quiz Interactively"):
-                score = 0
-                user_answers = []
-                
-                for i, q in enumerate(quiz_questions):
-                    st.subheader(f"Question {i+1}")
-                    st.write(q['question'])
-                    
-                    user_answer = st.radio(
-                        f"Select your answer for Question {i+1}:",
-                        options=range(len(q['options'])),
-                        format_func=lambda x: f"{chr(65+x)}. {quiz_questions[st.session_state.get('current_q', i)]['options'][x]}",
-                        key=f"q_{i}"
-                    )
-                    user_answers.append(user_answer)
-                
-                if st.button("Submit Quiz"):
-                    for i, (user_ans, q) in enumerate(zip(user_answers, quiz_questions)):
-                        if user_ans == q['correct_answer']:
-                            score += 1
-                    
-                    st.balloons()
-                    st.success(f"🎉 Your Score: {score}/{len(quiz_questions)} ({score/len(quiz_questions)*100:.1f}%)")
-            
-            else:
-                # Display quiz with answers
-                for i, q in enumerate(quiz_questions, 1):
-                    with st.expander(f"Question {i}: {q['question']}", expanded=True):
-                        for j, option in enumerate(q['options']):
-                            if j == q['correct_answer']:
-                                st.success(f"✅ {chr(65+j)}. {option}")
-                            else:
-                                st.write(f"{chr(65+j)}. {option}")
-                        
-                        st.info(f"💡 Explanation: {q['explanation']}")
-            
-            # Download section
-            st.header("💾 Export Options")
-            
-            # Create downloadable content
-            export_content = "# Generated Assignments and Quiz\n\n"
-            export_content += "## Assignment Questions\n\n"
-            for i, assignment in enumerate(assignments, 1):
-                export_content += f"**Assignment {i}:**\n{assignment}\n\n"
-            
-            export_content += "## Quiz Questions\n\n"
-            for i, q in enumerate(quiz_questions, 1):
-                export_content += f"**Question {i}:** {q['question']}\n"
-                for j, option in enumerate(q['options']):
-                    marker = "✅" if j == q['correct_answer'] else "  "
-                    export_content += f"{marker} {chr(65+j)}. {option}\n"
-                export_content += f"*Explanation: {q['explanation']}*\n\n"
-            
-            st.download_button(
-                label="📄 Download as Text File",
-                data=export_content,
-                file_name="assignments_and_quiz.txt",
-                mime="text/plain"
-            )
-        
-        else:
-            st.error("⚠️ Please enter some text content to generate assignments and quiz questions.")
-    
+    # Generate button (fragment: interactions inside don't rerun the page)
+    _generation_section(input_text, topic)
+
     # Example content
     if st.button("📖 Load Example Content"):
         example_text = """